@@ -0,0 +1,42 @@
+"""
+Measure cold-start cost of importing the SDK.
+
+    python benchmarks/import_time.py [--runs N]
+
+Each sample runs in a fresh interpreter so no module is cached.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "import ventaw": "import ventaw",
+    "ventaw.Queue": "import ventaw; ventaw.Queue",
+    "ventaw.Queue + Client(urllib)": "import ventaw; ventaw.Queue; ventaw.Client(api_key='x', transport='urllib')",
+    "all resources": "import ventaw; ventaw.Sandbox; ventaw.Template; ventaw.Queue; ventaw.Topic",
+}
+
+TIMER = "import time; t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)"
+
+
+def sample(stmt: str) -> float:
+    out = subprocess.check_output([sys.executable, "-c", TIMER.format(stmt=stmt)], cwd=ROOT)
+    return float(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, stmt in CASES.items():
+        times = [sample(stmt) * 1000 for _ in range(args.runs)]
+        print(f"{name:32} median {statistics.median(times):7.2f} ms   min {min(times):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from ventaw.client import Client
+from ventaw.error import APIError, RateLimitError
+from ventaw.rate_limit import (
+    EXEC, FILES, LIFECYCLE, MESSAGING, Limit, RateLimiter, classify_endpoint, parse_retry_after,
+)
+
+
+class StubResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    @property
+    def text(self):
+        return str(self._body)
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("No body")
+        return self._body
+
+
+class StubTransport:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        return self.responses.pop(0)
+
+
+def make_client(limiter, responses):
+    client = Client(api_key="test", base_url="http://api.test/v1", rate_limiter=limiter)
+    client._transport = StubTransport(responses)
+    return client
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/sandboxes/1/files/list", FILES),
+    ("/sandboxes/1/files", FILES),
+    ("/sandboxes/1/execute", EXEC),
+    ("/sandboxes/1/pty/p1/input", EXEC),
+    ("/sandboxes/1/sessions", EXEC),
+    ("http://api.test/mcp/tools", EXEC),
+    ("/queues/q1/messages", MESSAGING),
+    ("/messages/ack", MESSAGING),
+    ("/topics/t1/publish", MESSAGING),
+    ("/sandboxes", LIFECYCLE),
+    ("/sandboxes/1/start", LIFECYCLE),
+    ("/templates", LIFECYCLE),
+])
+def test_classify_endpoint(path, expected):
+    assert classify_endpoint(path) == expected
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after("inf") is None
+    assert parse_retry_after("nan") is None
+    assert parse_retry_after("junk") is None
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+
+
+def test_limit_validation():
+    with pytest.raises(ValueError):
+        Limit(rate=0)
+    with pytest.raises(ValueError):
+        Limit(rate=5, burst=0)
+    with pytest.raises(ValueError):
+        Limit(max_in_flight=0)
+    with pytest.raises(ValueError):
+        RateLimiter(limits={"bogus": Limit()})
+
+
+def test_burst_then_refill():
+    limiter = RateLimiter(limits={EXEC: Limit(rate=20, burst=5)})
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire(EXEC)
+        limiter.release(EXEC)
+    assert time.monotonic() - start < 0.05
+    for _ in range(4):
+        limiter.acquire(EXEC)
+        limiter.release(EXEC)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_max_in_flight_across_threads():
+    limiter = RateLimiter(limits={FILES: Limit(max_in_flight=2)})
+    peak = []
+
+    def work():
+        with limiter.limit(FILES):
+            peak.append(limiter.in_flight(FILES))
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(peak) == 2
+    assert limiter.in_flight(FILES) == 0
+
+
+def test_async_waiters_woken_by_release():
+    limiter = RateLimiter(limits={EXEC: Limit(max_in_flight=2)})
+    peak = []
+    polls = []
+    original = limiter._try_acquire
+
+    def counting_try_acquire(endpoint):
+        polls.append(endpoint)
+        return original(endpoint)
+
+    limiter._try_acquire = counting_try_acquire
+
+    async def work():
+        async with limiter.limit_async(EXEC):
+            peak.append(limiter.in_flight(EXEC))
+            await asyncio.sleep(0.05)
+
+    async def main():
+        await asyncio.wait_for(asyncio.gather(*[work() for _ in range(6)]), timeout=2)
+
+    asyncio.run(main())
+    assert max(peak) == 2
+    assert limiter.in_flight(EXEC) == 0
+    # Each task only re-checks after a release, not on a polling timer.
+    assert len(polls) < 40
+
+
+def test_async_waiter_woken_by_thread_release():
+    limiter = RateLimiter(limits={EXEC: Limit(max_in_flight=1)})
+    limiter.acquire(EXEC)
+    threading.Timer(0.05, limiter.release, args=(EXEC,)).start()
+
+    async def main():
+        await asyncio.wait_for(limiter.acquire_async(EXEC), timeout=2)
+
+    asyncio.run(main())
+    assert limiter.in_flight(EXEC) == 1
+    limiter.release(EXEC)
+
+
+def test_cancelled_async_waiter_is_removed():
+    limiter = RateLimiter(limits={EXEC: Limit(max_in_flight=1)})
+    limiter.acquire(EXEC)
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire_async(EXEC), timeout=0.05)
+
+    asyncio.run(main())
+    assert limiter._async_waiters[EXEC] == []
+    limiter.release(EXEC)
+    assert limiter.in_flight(EXEC) == 0
+
+
+def test_throttle_halves_rate_down_to_floor():
+    limiter = RateLimiter(limits={EXEC: Limit(rate=16)}, min_rate_factor=0.25)
+    limiter.record_throttled(EXEC, 0)
+    assert limiter.current_rate(EXEC) == 8
+    limiter.record_throttled(EXEC, 0)
+    assert limiter.current_rate(EXEC) == 4
+    limiter.record_throttled(EXEC, 0)
+    assert limiter.current_rate(EXEC) == 4
+
+
+def test_recovery_after_successes():
+    limiter = RateLimiter(limits={EXEC: Limit(rate=10)}, recovery_factor=0.1)
+    limiter.record_throttled(EXEC, 0)
+    assert limiter.current_rate(EXEC) == 5
+    limiter.record_success(EXEC)
+    assert limiter.current_rate(EXEC) == pytest.approx(6)
+    for _ in range(10):
+        limiter.record_success(EXEC)
+    assert limiter.current_rate(EXEC) == 10
+
+
+def test_retry_after_hold_is_capped():
+    limiter = RateLimiter(max_retry_after=0.05)
+    assert limiter.record_throttled(EXEC, 3600) == 3600
+    start = time.monotonic()
+    limiter.acquire(EXEC)
+    assert time.monotonic() - start < 0.5
+
+
+def test_client_retries_429_then_succeeds():
+    limiter = RateLimiter(limits={MESSAGING: Limit(rate=100)})
+    client = make_client(limiter, [
+        StubResponse(429, {"detail": "slow"}, {"Retry-After": "0"}),
+        StubResponse(429, {"detail": "slow"}, {"Retry-After": "0"}),
+        StubResponse(200, {"message_id": "m1"}),
+    ])
+    assert client.request("POST", "/queues/q1/messages") == {"message_id": "m1"}
+    assert len(client.transport.calls) == 3
+    assert limiter.current_rate(MESSAGING) < 100
+
+
+def test_client_gives_up_after_max_retries():
+    limiter = RateLimiter(max_retries=2)
+    client = make_client(limiter, [StubResponse(429, {"detail": "slow"}, {"Retry-After": "0"})] * 3)
+    with pytest.raises(RateLimitError) as exc:
+        client.request("GET", "/sandboxes")
+    assert exc.value.status_code == 429
+    assert exc.value.retry_after == 0.0
+    assert len(client.transport.calls) == 3
+
+
+def test_client_raises_when_retry_after_exceeds_max():
+    limiter = RateLimiter(max_retry_after=1)
+    client = make_client(limiter, [StubResponse(429, {"detail": "slow"}, {"Retry-After": "3600"})])
+    with pytest.raises(RateLimitError) as exc:
+        client.request("GET", "/sandboxes")
+    assert exc.value.retry_after == 3600
+    assert len(client.transport.calls) == 1
+
+
+def test_client_only_records_success_for_2xx():
+    limiter = RateLimiter(limits={EXEC: Limit(rate=10)})
+    limiter.record_throttled(EXEC, 0)
+    client = make_client(limiter, [StubResponse(500, {"detail": "boom"})])
+    with pytest.raises(APIError) as exc:
+        client.request("POST", "/sandboxes/1/execute")
+    assert exc.value.status_code == 500
+    assert limiter.current_rate(EXEC) == 5
+
+
+def test_client_reuses_slot_held_by_limit_async():
+    limiter = RateLimiter(limits={EXEC: Limit(rate=100, max_in_flight=1)})
+    client = make_client(limiter, [StubResponse(200, {"ok": True})])
+
+    async def main():
+        async with limiter.limit_async(EXEC):
+            assert limiter.in_flight(EXEC) == 1
+            return client.request("POST", "/sandboxes/1/execute")
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert limiter.in_flight(EXEC) == 0
+
+
+def test_held_slot_raises_on_429_instead_of_sleeping():
+    limiter = RateLimiter(limits={EXEC: Limit(max_in_flight=1)})
+    client = make_client(limiter, [StubResponse(429, {"detail": "slow"}, {"Retry-After": "30"})])
+    with limiter.limit(EXEC):
+        with pytest.raises(RateLimitError):
+            client.request("POST", "/sandboxes/1/execute")
+    assert len(client.transport.calls) == 1
@@ -0,0 +1,189 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ventaw.client import Client
+from ventaw.error import APIConnectionError, APIError, AuthenticationError
+from ventaw.transports import UrllibTransport
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _echo(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self._send(200, {
+            "method": self.command,
+            "path": self.path,
+            "content_type": self.headers.get("Content-Type"),
+            "authorization": self.headers.get("Authorization"),
+            "body": body.decode("latin-1"),
+        })
+
+    def do_GET(self):
+        if self.path.startswith("/v1/unauthorized"):
+            return self._send(401, {"detail": "bad key"})
+        if self.path.startswith("/v1/missing"):
+            return self._send(404, b"not found", "text/plain")
+        if self.path.startswith("/v1/download"):
+            return self._send(200, b"\x00raw-bytes", "application/octet-stream")
+        self._echo()
+
+    do_POST = _echo
+    do_DELETE = _echo
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(base_url):
+    return Client(api_key="secret", base_url=base_url, transport="urllib")
+
+
+def test_params_and_headers(client):
+    data = client.request("GET", "/files/list", params={"path": "/tmp", "recursive": "true", "skip": None})
+    assert data["path"] == "/v1/files/list?path=%2Ftmp&recursive=true"
+    assert data["authorization"] == "Bearer secret"
+
+
+def test_json_body(client):
+    data = client.request("POST", "/queues/q1/messages", json={"body": {"a": 1}, "delay_seconds": 0})
+    assert data["method"] == "POST"
+    assert data["content_type"] == "application/json"
+    assert json.loads(data["body"]) == {"body": {"a": 1}, "delay_seconds": 0}
+
+
+def test_multipart_upload(client):
+    files = {"file": ("hello.txt", b"hello\x00world", "application/octet-stream")}
+    data = client.request("POST", "/files/upload", params={"path": "/a/hello.txt"}, files=files)
+    assert data["content_type"].startswith("multipart/form-data; boundary=")
+    boundary = data["content_type"].split("boundary=")[1]
+    body = data["body"]
+    assert body.startswith(f"--{boundary}\r\n")
+    assert 'name="file"; filename="hello.txt"' in body
+    assert "hello\x00world\r\n" in body
+    assert body.endswith(f"--{boundary}--\r\n")
+
+
+def test_raw_response(client):
+    resp = client.request_raw("GET", "/download")
+    assert resp.status_code == 200
+    assert resp.content == b"\x00raw-bytes"
+    assert resp.headers.get("content-type") == "application/octet-stream"
+
+
+def test_error_statuses(client):
+    with pytest.raises(AuthenticationError):
+        client.request("GET", "/unauthorized")
+    with pytest.raises(APIError) as exc:
+        client.request("GET", "/missing")
+    assert exc.value.status_code == 404
+    assert str(exc.value) == "not found"
+
+
+def test_connection_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = UrllibTransport({})
+    with pytest.raises(APIConnectionError):
+        transport.request("GET", f"http://127.0.0.1:{port}/")
+
+
+def test_malformed_response_is_connection_error():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def respond():
+        conn, _ = server.accept()
+        conn.recv(4096)
+        conn.sendall(b"garbage\r\n\r\n")
+        conn.close()
+
+    thread = threading.Thread(target=respond, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(APIConnectionError):
+            UrllibTransport({}).request("GET", f"http://127.0.0.1:{server.getsockname()[1]}/")
+    finally:
+        thread.join(timeout=2)
+        server.close()
+
+
+def test_session_requires_requests_transport(client):
+    with pytest.raises(AttributeError, match="urllib"):
+        client.session
+
+
+def test_unknown_transport():
+    with pytest.raises(ValueError):
+        Client(api_key="secret", transport="bogus")
+
+
+def test_lazy_import_does_not_load_heavy_modules():
+    code = (
+        "import sys, ventaw\n"
+        "assert 'ventaw.client' not in sys.modules\n"
+        "ventaw.Queue\n"
+        "assert 'ventaw.api_resources.queue' in sys.modules\n"
+        "assert 'ventaw.api_resources.sandbox' not in sys.modules\n"
+        "for name in ('requests', 'asyncio', 'urllib.request', 'ventaw.rate_limit'):\n"
+        "    assert name not in sys.modules, name\n"
+        "assert ventaw.Queue is sys.modules['ventaw.api_resources.queue'].Queue\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_urllib_request_does_not_load_requests(base_url):
+    code = (
+        "import sys, ventaw\n"
+        f"client = ventaw.Client(api_key='secret', base_url={base_url!r}, transport='urllib')\n"
+        "assert client.request('GET', '/ping')['path'] == '/v1/ping'\n"
+        "assert 'requests' not in sys.modules\n"
+        "assert 'asyncio' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_session_setter_switches_to_requests_transport(client):
+    class FakeSession:
+        def __init__(self):
+            self.headers = {"User-Agent": "custom"}
+
+    session = FakeSession()
+    client.session = session
+    assert client.transport_name == "requests"
+    assert client.session is session
+    assert session.headers["User-Agent"] == "custom"
+    assert session.headers["Authorization"] == "Bearer secret"
+
+
+def test_unknown_attribute():
+    import ventaw
+    with pytest.raises(AttributeError):
+        ventaw.DoesNotExist
@@ -1,12 +1,37 @@
 
+import importlib
 from typing import Optional
 
 # Global Configuration
 api_key: Optional[str] = None
 api_base: str = "https://api.ventaw.com/v1"
+rate_limiter = None  # Optional[ventaw.rate_limit.RateLimiter], shared by default clients
+transport: str = "requests"  # "requests" (pooled) or "urllib" (stdlib-only)
 
-from ventaw.client import Client
-from ventaw.api_resources.sandbox import Sandbox
-from ventaw.api_resources.template import Template
-from ventaw.api_resources.queue import Queue
-from ventaw.api_resources.topic import Topic, Subscription
+# Public names are resolved on first access (PEP 562) so `import ventaw`
+# doesn't pay for modules the caller never touches.
+_LAZY_ATTRS = {
+    "Client": "ventaw.client",
+    "RateLimiter": "ventaw.rate_limit",
+    "Limit": "ventaw.rate_limit",
+    "Sandbox": "ventaw.api_resources.sandbox",
+    "Template": "ventaw.api_resources.template",
+    "Queue": "ventaw.api_resources.queue",
+    "Topic": "ventaw.api_resources.topic",
+    "Subscription": "ventaw.api_resources.topic",
+}
+
+__all__ = ["api_key", "api_base", "rate_limiter", "transport", *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
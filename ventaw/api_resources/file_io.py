@@ -21,19 +21,11 @@ class FileIO:
         Read file content.
         :param encoding: 'utf-8' (default) or 'base64'.
         """
-        # The client.request method typically expects JSON response. 
-        # But download endpoint returns stream/text. 
-        # We need to bypass the auto-JSON parsing in client.request or handle it.
-        # Let's check client.request implementation again.
-        # It calls response.json(). This won't work for download.
-        # We might need to access the session directly or add a raw flag.
-        
-        # Accessing session directly for now since request() enforces JSON.
-        url = f"{self.client.base_url}/sandboxes/{self.sandbox_id}/files/download"
-        resp = self.client.session.get(url, params={"path": path})
-        
-        if not 200 <= resp.status_code < 300:
-             self.client._handle_error(resp)
+        resp = self.client.request_raw(
+            "GET",
+            f"/sandboxes/{self.sandbox_id}/files/download",
+            params={"path": path}
+        )
              
         content_bytes = resp.content
         if encoding == "base64":
@@ -47,8 +39,6 @@ class FileIO:
         :param content: Text or Base64 string.
         :param encoding: 'utf-8' (content is text) or 'base64' (content is b64).
         """
-        url = f"{self.client.base_url}/sandboxes/{self.sandbox_id}/files/upload"
-        
         if encoding == "base64":
             file_content = base64.b64decode(content)
         else:
@@ -57,10 +47,12 @@ class FileIO:
         # Requests Multipart Upload
         files = {'file': (path.split('/')[-1], file_content, 'application/octet-stream')}
         
-        resp = self.client.session.post(url, params={"path": path}, files=files)
-        
-        if not 200 <= resp.status_code < 300:
-             self.client._handle_error(resp)
+        resp = self.client.request_raw(
+            "POST",
+            f"/sandboxes/{self.sandbox_id}/files/upload",
+            params={"path": path},
+            files=files
+        )
              
         # API returns {"bytes_written": N}
         return resp.json().get("bytes_written", len(file_content))
@@ -71,9 +71,7 @@ class Sandbox:
             raise RuntimeError("Client base URL not available for MCP request")
         root = base.rsplit("/", 1)[0]
         url = f"{root}/mcp/tools"
-        resp = self._client.session.post(url, json={"name": tool_name, "arguments": arguments})
-        if not 200 <= resp.status_code < 300:
-            self._client._handle_error(resp)
+        resp = self._client.request_raw("POST", url, json={"name": tool_name, "arguments": arguments})
         return resp.json().get("content", [])
 
     def _parse_mcp_text(self, content: List[Dict[str, Any]]) -> str:
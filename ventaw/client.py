@@ -1,40 +1,106 @@
 
-import requests
-from typing import Optional, Any, Dict
+from typing import TYPE_CHECKING, Optional, Any, Dict
 
 import ventaw
-from ventaw.error import APIError, AuthenticationError, APIConnectionError
+from ventaw.error import APIError, AuthenticationError, RateLimitError
+from ventaw.transports import TRANSPORTS, RequestsTransport
+
+# ventaw.rate_limit is only loaded when a limiter is configured or a 429 arrives.
+if TYPE_CHECKING:
+    from ventaw.rate_limit import RateLimiter
 
 class Client:
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        transport: Optional[str] = None,
+    ):
         self.api_key = api_key or ventaw.api_key
         self.base_url = (base_url or ventaw.api_base).rstrip("/")
+        self.rate_limiter = rate_limiter or ventaw.rate_limiter
         
         if not self.api_key:
             raise AuthenticationError("No API key provided. Set ventaw.api_key or pass api_key to Client constructor.")
-            
-        self.session = requests.Session()
-        self.session.headers.update({
+
+        transport = transport or ventaw.transport
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport: {transport}. Expected one of: {', '.join(TRANSPORTS)}")
+        self.transport_name = transport
+        self._transport = None
+        self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "User-Agent": "VentawPythonSDK/0.1.2"
-        })
+        }
 
-    def request(self, method: str, path: str, **kwargs) -> Any:
-        url = f"{self.base_url}{path}"
-        try:
-            response = self.session.request(method, url, **kwargs)
-        except requests.exceptions.RequestException as e:
-            raise APIConnectionError(f"Connection error: {e}")
+    @property
+    def transport(self):
+        """HTTP transport, built on first use."""
+        if self._transport is None:
+            self._transport = TRANSPORTS[self.transport_name](self.headers)
+        return self._transport
 
-        if not 200 <= response.status_code < 300:
-            self._handle_error(response)
-            
+    @property
+    def session(self):
+        """Underlying `requests.Session`. Only available with the requests transport."""
+        if self.transport_name != "requests":
+            raise AttributeError(f"Client.session is only available with the 'requests' transport (this client uses '{self.transport_name}').")
+        return self.transport.session
+
+    @session.setter
+    def session(self, session):
+        """Use a caller-supplied `requests.Session` (switches to the requests transport)."""
+        for key, value in self.headers.items():
+            session.headers.setdefault(key, value)
+        self.transport_name = "requests"
+        self._transport = RequestsTransport(self.headers, session=session)
+
+    def request(self, method: str, path: str, **kwargs) -> Any:
+        response = self.request_raw(method, path, **kwargs)
         try:
             return response.json()
         except ValueError:
             return None # Empty body
 
+    def request_raw(self, method: str, path: str, **kwargs) -> Any:
+        """
+        Send a request and return the raw response (for non-JSON endpoints).
+        :param path: API path relative to base_url, or an absolute URL.
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        limiter = self.rate_limiter
+        if limiter:
+            from ventaw.rate_limit import classify_endpoint, parse_retry_after
+            endpoint = classify_endpoint(path)
+        # Inside limiter.limit()/limit_async() the caller already holds a slot.
+        held = bool(limiter) and limiter.holds(endpoint)
+        attempt = 0
+        while True:
+            if limiter and not held:
+                limiter.acquire(endpoint)
+            try:
+                response = self.transport.request(method, url, **kwargs)
+            finally:
+                if limiter and not held:
+                    limiter.release(endpoint)
+
+            if not limiter:
+                break
+            if response.status_code != 429:
+                if 200 <= response.status_code < 300:
+                    limiter.record_success(endpoint)
+                break
+            retry_after = limiter.record_throttled(endpoint, parse_retry_after(response.headers.get("Retry-After")))
+            if held or attempt >= limiter.max_retries or retry_after > limiter.max_retry_after:
+                break
+            attempt += 1
+
+        if not 200 <= response.status_code < 300:
+            self._handle_error(response)
+        return response
+
     def _handle_error(self, response):
         try:
             data = response.json()
@@ -44,6 +110,9 @@ class Client:
             
         if response.status_code == 401:
             raise AuthenticationError(message)
+        elif response.status_code == 429:
+            from ventaw.rate_limit import parse_retry_after
+            raise RateLimitError(message, retry_after=parse_retry_after(response.headers.get("Retry-After")))
         else:
             raise APIError(message, status_code=response.status_code)
 
@@ -12,3 +12,8 @@ class AuthenticationError(APIError):
 
 class APIConnectionError(VentawError):
     pass
+
+class RateLimitError(APIError):
+    def __init__(self, message, status_code=429, retry_after=None):
+        super().__init__(message, status_code=status_code)
+        self.retry_after = retry_after
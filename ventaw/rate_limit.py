@@ -0,0 +1,277 @@
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+# asyncio and email.utils are imported where they're used: they dominate the
+# cost of loading this module and most callers never need them.
+
+# Endpoint classes
+LIFECYCLE = "lifecycle"
+FILES = "files"
+EXEC = "exec"
+MESSAGING = "messaging"
+
+ENDPOINT_CLASSES = (LIFECYCLE, FILES, EXEC, MESSAGING)
+
+_EXEC_SEGMENTS = {"execute", "pty", "sessions", "mcp"}
+_MESSAGING_SEGMENTS = {"queues", "topics", "messages"}
+
+# (limiter, endpoint) pairs whose slot is held by the current thread/task via
+# `limit` / `limit_async`; the client doesn't acquire a second one for them.
+_held: ContextVar = ContextVar("ventaw_rate_limit_held", default=frozenset())
+
+
+def classify_endpoint(path: str) -> str:
+    """Map a request path (or absolute URL) to its endpoint class."""
+    path = path.split("?", 1)[0].split("://", 1)[-1]
+    segments = set(path.strip("/").split("/"))
+    if "files" in segments:
+        return FILES
+    if segments & _EXEC_SEGMENTS:
+        return EXEC
+    if segments & _MESSAGING_SEGMENTS:
+        return MESSAGING
+    return LIFECYCLE
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+class Limit:
+    """
+    Limits for one endpoint class.
+    :param rate: Sustained requests per second (None = unlimited).
+    :param burst: Token bucket capacity (defaults to max(1, rate)).
+    :param max_in_flight: Maximum concurrent requests (None = unlimited).
+    """
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None, max_in_flight: Optional[int] = None):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+
+    def __repr__(self):
+        return f"<Limit rate={self.rate} burst={self.burst} max_in_flight={self.max_in_flight}>"
+
+
+class _Bucket:
+    def __init__(self, limit: Limit):
+        self.limit = limit
+        self.rate = limit.rate
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+
+    def refill(self, now: float):
+        if self.rate is not None:
+            elapsed = now - self.updated
+            self.tokens = min(float(self.limit.burst), self.tokens + elapsed * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter plus in-flight governor, keyed by endpoint class
+    (lifecycle, files, exec, messaging). Thread-safe; share one instance
+    across clients to cap the whole process.
+
+    On 429 the class's rate is halved (down to `min_rate_factor` of the
+    configured rate) and requests are held until Retry-After elapses; each
+    success then restores `recovery_factor` of the configured rate. A
+    Retry-After above `max_retry_after` is not waited out: the client raises
+    RateLimitError instead.
+
+    `limit` / `limit_async` hold a slot for the enclosed block. SDK calls made
+    inside it reuse that slot rather than taking another one, and raise
+    RateLimitError on 429 instead of sleeping, so `limit_async` never blocks
+    the event loop waiting on the limiter.
+    """
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Limit]] = None,
+        default: Optional[Limit] = None,
+        max_retries: int = 3,
+        max_retry_after: float = 60.0,
+        min_rate_factor: float = 0.1,
+        recovery_factor: float = 0.05,
+    ):
+        limits = limits or {}
+        unknown = set(limits) - set(ENDPOINT_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown endpoint class(es): {', '.join(sorted(unknown))}")
+        default = default or Limit()
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.min_rate_factor = min_rate_factor
+        self.recovery_factor = recovery_factor
+        self._buckets = {name: _Bucket(limits.get(name, default)) for name in ENDPOINT_CLASSES}
+        self._cond = threading.Condition()
+        # Futures of coroutines waiting for an in-flight slot, woken by `release`.
+        self._async_waiters = {name: [] for name in ENDPOINT_CLASSES}
+
+    def _bucket(self, endpoint: str) -> _Bucket:
+        try:
+            return self._buckets[endpoint]
+        except KeyError:
+            raise ValueError(f"Unknown endpoint class: {endpoint}")
+
+    def _try_acquire(self, endpoint: str) -> Optional[float]:
+        """Take a token and a slot. Returns 0 on success, else seconds to wait (None = until a release)."""
+        bucket = self._bucket(endpoint)
+        now = time.monotonic()
+        bucket.refill(now)
+        if now < bucket.blocked_until:
+            return bucket.blocked_until - now
+        max_in_flight = bucket.limit.max_in_flight
+        if max_in_flight is not None and bucket.in_flight >= max_in_flight:
+            return None
+        if bucket.rate is not None and bucket.tokens < 1:
+            return (1 - bucket.tokens) / bucket.rate
+        if bucket.rate is not None:
+            bucket.tokens -= 1
+        bucket.in_flight += 1
+        return 0
+
+    def acquire(self, endpoint: str):
+        """Block the calling thread until a request for `endpoint` may be sent."""
+        with self._cond:
+            while True:
+                wait = self._try_acquire(endpoint)
+                if wait == 0:
+                    return
+                self._cond.wait(timeout=wait)
+
+    async def acquire_async(self, endpoint: str):
+        """Wait without blocking the event loop until a request for `endpoint` may be sent."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                wait = self._try_acquire(endpoint)
+                if wait is None:
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters[endpoint].append(waiter)
+            if wait == 0:
+                return
+            if wait is not None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter[1]
+            finally:
+                with self._cond:
+                    if waiter in self._async_waiters[endpoint]:
+                        self._async_waiters[endpoint].remove(waiter)
+
+    def release(self, endpoint: str):
+        """Return the in-flight slot taken by `acquire`."""
+        with self._cond:
+            bucket = self._bucket(endpoint)
+            bucket.in_flight = max(0, bucket.in_flight - 1)
+            self._cond.notify_all()
+            waiters, self._async_waiters[endpoint] = self._async_waiters[endpoint], []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def holds(self, endpoint: str) -> bool:
+        """Whether the current thread/task is inside `limit` / `limit_async` for `endpoint`."""
+        return (self, endpoint) in _held.get()
+
+    def _enter_held(self, endpoint: str):
+        return _held.set(_held.get() | {(self, endpoint)})
+
+    @contextmanager
+    def limit(self, endpoint: str):
+        self.acquire(endpoint)
+        token = self._enter_held(endpoint)
+        try:
+            yield
+        finally:
+            _held.reset(token)
+            self.release(endpoint)
+
+    def limit_async(self, endpoint: str) -> "_AsyncLimit":
+        return _AsyncLimit(self, endpoint)
+
+    def record_success(self, endpoint: str):
+        """Additively restore the rate of `endpoint` after a successful response."""
+        with self._cond:
+            bucket = self._bucket(endpoint)
+            configured = bucket.limit.rate
+            if configured is not None and bucket.rate < configured:
+                bucket.rate = min(configured, bucket.rate + configured * self.recovery_factor)
+
+    def record_throttled(self, endpoint: str, retry_after: Optional[float] = None) -> float:
+        """
+        Back off `endpoint` after a 429. Returns the requested hold-off in
+        seconds; the class is held for at most `max_retry_after`.
+        """
+        with self._cond:
+            bucket = self._bucket(endpoint)
+            now = time.monotonic()
+            bucket.refill(now)
+            configured = bucket.limit.rate
+            if configured is not None:
+                bucket.rate = max(configured * self.min_rate_factor, bucket.rate / 2)
+            bucket.tokens = 0.0
+            if retry_after is None:
+                retry_after = 1 / bucket.rate if bucket.rate is not None else 1.0
+            hold = min(retry_after, self.max_retry_after)
+            bucket.blocked_until = max(bucket.blocked_until, now + hold)
+            return retry_after
+
+    def current_rate(self, endpoint: str) -> Optional[float]:
+        """Effective requests per second for `endpoint` after adaptation."""
+        with self._cond:
+            return self._bucket(endpoint).rate
+
+    def in_flight(self, endpoint: str) -> int:
+        with self._cond:
+            return self._bucket(endpoint).in_flight
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class _AsyncLimit:
+    def __init__(self, limiter: RateLimiter, endpoint: str):
+        self._limiter = limiter
+        self._endpoint = endpoint
+        self._token = None
+
+    async def __aenter__(self):
+        await self._limiter.acquire_async(self._endpoint)
+        self._token = self._limiter._enter_held(self._endpoint)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        _held.reset(self._token)
+        self._limiter.release(self._endpoint)
@@ -0,0 +1,113 @@
+
+import os
+from typing import Any, Dict, Optional
+
+from ventaw.error import APIConnectionError
+
+# HTTP libraries (requests, urllib.request, which pulls in ssl) are imported on
+# first use, not at import time, so short-lived processes only pay for the
+# transport they actually use.
+
+
+class RequestsTransport:
+    """Default transport backed by a pooled `requests.Session`."""
+    def __init__(self, headers: Dict[str, str], session=None):
+        self.headers = headers
+        self._session = session
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        import requests
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            raise APIConnectionError(f"Connection error: {e}")
+
+
+class UrllibResponse:
+    """Minimal response mirroring the parts of `requests.Response` the SDK uses."""
+    def __init__(self, status_code: int, headers, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        import json
+        return json.loads(self.content)
+
+
+class UrllibTransport:
+    """
+    Stdlib-only transport (no connection pooling). Suited to short-lived
+    processes that make a handful of calls and want to skip importing requests.
+    """
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        files: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> UrllibResponse:
+        import http.client
+        import json as _json
+        import urllib.error
+        import urllib.parse
+        import urllib.request
+
+        if params:
+            query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+
+        headers = dict(self.headers)
+        body = None
+        if files:
+            body, headers["Content-Type"] = _encode_multipart(files)
+        elif json is not None:
+            body = _json.dumps(json).encode("utf-8")
+
+        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        try:
+            with urllib.request.urlopen(req, **kwargs) as resp:
+                return UrllibResponse(resp.status, resp.headers, resp.read())
+        except urllib.error.HTTPError as e:
+            return UrllibResponse(e.code, e.headers, e.read())
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            raise APIConnectionError(f"Connection error: {e}")
+
+
+def _encode_multipart(files: Dict[str, Any]):
+    boundary = os.urandom(16).hex()
+    parts = []
+    for field, (filename, content, content_type) in files.items():
+        parts.append(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8")
+        )
+        parts.append(content if isinstance(content, bytes) else content.encode("utf-8"))
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "urllib": UrllibTransport,
+}